@@ -6,25 +6,56 @@ LangChain 기반 채용공고 요약 시스템
 import sys
 import os
 import argparse
+import itertools
 import logging
+import threading
+from typing import Iterable, Iterator, List
 
-from src.discord.discord_sender import SimpleDiscordSender
+from src.langchain.chain import JobSummaryChain
 from src.parser.parser_bot import WebParser
 from src.summarizer.posting_summarizer import JobPostingSummarizer
 
 LOGGER = logging.getLogger("jd_scanner")
 
 
+def _warm_up_in_background(model_name: str, temperature: float) -> None:
+    """URL 입력/스크래핑과 동시에 Ollama 모델이 로드되도록 백그라운드 워밍업 시작"""
 
+    def _run():
+        try:
+            JobSummaryChain(model_name=model_name, temperature=temperature).warm_up()
+        except Exception as e:
+            # 실패해도 요약 단계에서 다시 시도되므로 경고만 남김
+            LOGGER.warning("LLM 워밍업 실패: %s", e)
+
+    threading.Thread(target=_run, daemon=True).start()
+
+
+def _echo_stream(chunks: Iterable[str], parts: List[str]) -> Iterator[str]:
+    """요약 조각을 터미널에 바로 출력하고 parts에 모으면서 그대로 전달"""
+    for chunk in chunks:
+        sys.stdout.write(chunk)
+        sys.stdout.flush()
+        parts.append(chunk)
+        yield chunk
 
 
 def main():
     """메인 함수"""
+    # LangSmith 트레이싱은 사용하지 않으므로 명시적으로 비활성화 (직접 켠 경우는 유지)
+    os.environ.setdefault("LANGCHAIN_TRACING_V2", "false")
+    os.environ.setdefault("LANGSMITH_TRACING", "false")
+
     parser = argparse.ArgumentParser(description="JD-Scanner: 채용공고 요약기")
     parser.add_argument("--url", help="채용공고 URL")
     parser.add_argument(
         "--model", default=os.getenv("MODEL_NAME", "gpt-oss:20b"), help="Ollama 모델명"
     )
+    parser.add_argument(
+        "--quant",
+        default=os.getenv("MODEL_QUANT", ""),
+        help="양자화 태그 (예: q4_K_M). 지정 시 모델 태그 뒤에 '-<quant>'를 붙여 사용",
+    )
     parser.add_argument(
         "--temperature",
         type=float,
@@ -38,6 +69,8 @@ def main():
         help="Discord 전송 활성화",
     )
     args = parser.parse_args()
+    model_name = f"{args.model}-{args.quant}" if args.quant else args.model
+    _warm_up_in_background(model_name, args.temperature)
 
     print("🧪 LangChain 기반 채용공고 요약 시스템 - MVP")
     print("=" * 50)
@@ -58,34 +91,48 @@ def main():
         # 요약기 초기화
         print("🔧 시스템 초기화 중...")
         webparser = WebParser(url=url)
+        summarizer = JobPostingSummarizer(
+            model_name=model_name, temperature=args.temperature
+        )
 
-        # 내용 추출
+        # 내용 추출 (LLM 모델 로드는 백그라운드에서 진행 중)
         print("📄 채용공고 내용 추출 중...")
         content = webparser.extract_content_from_url()
+        summarizer.content = content
         print(f"✅ 내용 추출 완료 (길이: {len(content)} 글자)")
 
-        # 요약 수행
+        # 요약 수행 (생성되는 대로 출력)
         print("🤖 AI 요약 처리 중... (시간이 조금 걸릴 수 있습니다)")
-        summarizer = JobPostingSummarizer(
-            content=content, model_name=args.model, temperature=args.temperature
+        print("\n" + "=" * 50)
+        print("📋 요약 결과:")
+        print("=" * 50)
+        parts = []
+        stream = _echo_stream(
+            itertools.chain(
+                summarizer.stream_job_posting(content), [f"  \n[채용공고]({url})"]
+            ),
+            parts,
         )
-        summary = summarizer.summarize_job_posting(content)
-        summary = f"{summary}  \n[채용공고]({url})"
 
-        # Discord 전송 (옵션)
+        # Discord 전송 (옵션, 요약이 생성되는 대로 메시지 수정)
         if args.discord:
-            sender = SimpleDiscordSender(summary)
+            # discord 패키지는 로딩이 무거우므로 전송 시에만 import
+            from src.discord.discord_sender import SimpleDiscordSender
+
+            sender = SimpleDiscordSender(stream)
             sender.run()
+            if sender.error is not None:
+                raise sender.error
         else:
             LOGGER.info(
                 "Discord 전송 비활성화 상태입니다. --discord 플래그 또는 DISCORD_ENABLED=true 설정 시 전송합니다."
             )
 
-        # 결과 출력
-        print("\n" + "=" * 50)
-        print("📋 요약 결과:")
-        print("=" * 50)
-        print(summary)
+        # Discord 전송을 건너뛴 경우 등 남은 요약을 마저 생성
+        for _ in stream:
+            pass
+        print()
+        summary = "".join(parts)
 
         # 파일 저장
         print("\n💾 결과 저장 중...")
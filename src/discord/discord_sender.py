@@ -1,15 +1,75 @@
 import discord
 import asyncio
+import atexit
 import os
 import sys
 import logging
+import threading
 from dotenv import load_dotenv
 from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+# 프로세스 내에서 재사용하는 Discord 클라이언트와 이를 구동하는 백그라운드 이벤트 루프
+# (전송마다 로그인/게이트웨이 핸드셰이크를 반복하지 않도록 한 번만 연결)
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_client: Optional[discord.Client] = None
+_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """백그라운드 스레드에서 도는 이벤트 루프 반환 (최초 호출 시 시작)"""
+    global _loop
+    if _loop is None:
+        _loop = asyncio.new_event_loop()
+        threading.Thread(target=_loop.run_forever, daemon=True).start()
+    return _loop
+
+
+async def _connect(token: str) -> discord.Client:
+    """로그인 후 on_ready까지 기다린 클라이언트 반환 (로그인 실패 시 예외)"""
+    client = discord.Client(intents=discord.Intents.default())
+    ready = asyncio.get_running_loop().create_future()
+
+    @client.event
+    async def on_ready():
+        print(f"✅ 봇 로그인 성공: {client.user}")
+        if not ready.done():
+            ready.set_result(None)
+
+    start_task = asyncio.ensure_future(client.start(token))
+    await asyncio.wait({start_task, ready}, return_when=asyncio.FIRST_COMPLETED)
+    if not ready.done():
+        # 로그인/연결 실패: start_task의 예외를 그대로 전달
+        await client.close()
+        start_task.result()
+        raise RuntimeError("Discord 연결이 종료되었습니다.")
+    return client
+
+
+def _get_client(token: str) -> discord.Client:
+    """공유 Discord 클라이언트 반환 (없거나 연결이 끊긴 경우에만 새로 로그인)"""
+    global _client
+    with _lock:
+        if _client is None or _client.is_closed():
+            future = asyncio.run_coroutine_threadsafe(_connect(token), _get_loop())
+            _client = future.result()
+        return _client
+
+
+@atexit.register
+def _close_client():
+    """프로세스 종료 시 공유 클라이언트 연결 정리"""
+    if _client is not None and not _client.is_closed() and _loop is not None:
+        try:
+            asyncio.run_coroutine_threadsafe(_client.close(), _loop).result(timeout=5)
+        except Exception:
+            pass
 
 
 class SimpleDiscordSender:
-    def __init__(self, message):
+    def __init__(self, message=None):
         self.enabled = True
+        self.message = message
         # .env 로드
         env_path = Path(__file__).parent.parent / ".env"
         load_dotenv(env_path)
@@ -29,20 +89,38 @@ class SimpleDiscordSender:
             )
             self.enabled = False
 
-        self.channel_ids = self.parse_channel_ids()
+        # 채널 ID는 생성 시점에 검증하여 잘못된 설정이면 로그인 자체를 생략
+        self.channel_ids = self.parse_channel_ids() if self.channel_ids_str else []
         if not self.channel_ids:
             self.enabled = False
 
-        # Discord client 설정
-        intents = discord.Intents.default()
-        self.client = discord.Client(intents=intents)
+        # 공유 클라이언트 (첫 전송 시 연결)
+        self.client: Optional[discord.Client] = None
+
+        # 채널 ID -> 채널 객체 (전송마다 REST 조회 반복 방지)
+        self._channel_cache: Dict[int, Any] = {}
 
-        # 이벤트 핸들러 등록
-        @self.client.event
-        async def on_ready():
-            print(f"✅ 봇 로그인 성공: {self.client.user}")
-            await self.send_message(message)
-            await self.client.close()
+        # 스트리밍 중 요약 생성 등에서 발생한 오류 (run 이후 호출자가 확인)
+        self.error = None
+
+    def send(self, message):
+        """
+        공유 클라이언트로 메시지 전송 (호출 스레드는 전송 완료까지 대기)
+
+        Args:
+            message: 전송할 문자열 또는 요약 조각 이터레이터
+        """
+        client = _get_client(self.token)  # type: ignore
+        if client is not self.client:
+            # 재연결된 클라이언트에는 이전 채널 객체를 쓰지 않음
+            self._channel_cache.clear()
+            self.client = client
+        if isinstance(message, str):
+            coro = self.send_message(message)
+        else:
+            # 토큰 이터레이터는 생성되는 대로 메시지를 수정하며 전송
+            coro = self.send_streaming(message)
+        asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
 
     def parse_channel_ids(self):
         """환경변수에서 채널 ID 문자열을 리스트로 파싱"""
@@ -65,63 +143,127 @@ class SimpleDiscordSender:
         return channel_ids
 
     async def send_message(self, content: str):
-        """여러 채널에 메시지 전송"""
+        """여러 채널에 메시지 전송 (채널별 전송은 동시에 진행)"""
         parts = self.split_message(content)
+        await asyncio.gather(
+            *(self._send_to_channel(channel_id, parts) for channel_id in self.channel_ids)
+        )
+
+    async def _get_channel(self, channel_id: int):
+        """채널 객체 반환 (캐시 → 게이트웨이 상태 → REST 조회 순)"""
+        channel = self._channel_cache.get(channel_id)
+        if channel is None:
+            channel = self.client.get_channel(channel_id)  # type: ignore
+            if channel is None:
+                channel = await self.client.fetch_channel(channel_id)  # type: ignore
+            self._channel_cache[channel_id] = channel
+        return channel
+
+    async def _send_to_channel(self, channel_id: int, parts):
+        """한 채널에 분할된 메시지를 순서대로 전송 (실패는 해당 채널만 건너뜀)"""
         total = len(parts)
+        try:
+            channel = await self._get_channel(channel_id)
+            for idx, part in enumerate(parts, start=1):
+                suffix = f"\n({idx}/{total})" if total > 1 else ""
+                await channel.send(part + suffix)  # type: ignore
+            print(f"📨 메시지 전송 완료: 채널 {channel_id}")
+        except Exception as e:
+            print(f"❌ 채널 {channel_id} 전송 실패: {e}")
+
+    async def send_streaming(self, token_iter: Iterable[str], interval: float = 1.0):
+        """
+        토큰이 생성되는 대로 여러 채널의 메시지를 주기적으로 수정하며 전송
+
+        Args:
+            token_iter: 요약 결과 조각 이터레이터 (블로킹 가능, 별도 스레드에서 소비)
+            interval: 메시지 수정 최소 간격(초), Discord 수정 rate limit 고려
+        """
+        channels = []
         for channel_id in self.channel_ids:
             try:
-                channel = await self.client.fetch_channel(channel_id)
-                for idx, part in enumerate(parts, start=1):
-                    suffix = f"\n({idx}/{total})" if total > 1 else ""
-                    await channel.send(part + suffix)  # type: ignore
-                print(f"📨 메시지 전송 완료: 채널 {channel_id}")
+                channels.append(await self._get_channel(channel_id))
             except Exception as e:
                 print(f"❌ 채널 {channel_id} 전송 실패: {e}")
 
+        loop = asyncio.get_running_loop()
+        iterator = iter(token_iter)
+        messages = {}  # 채널 ID -> 현재 수정 중인 메시지
+        buffer = ""
+        last_flush = loop.time()
+
+        while True:
+            token = await asyncio.to_thread(next, iterator, None)
+            if token is None:
+                break
+            buffer += token
+
+            # 제한 길이를 넘으면 앞부분을 확정하고 새 메시지로 이어서 전송
+            if len(buffer) > 1900:
+                # 마지막 조각은 다음 토큰과 이어지므로 공백을 유지한 채 버퍼로 남김
+                *done, buffer = self._split_at_boundaries(buffer, 1900)
+                for part in done:
+                    await self._update_streaming(channels, messages, part.strip())
+                    messages.clear()
+
+            if loop.time() - last_flush >= interval:
+                await self._update_streaming(channels, messages, buffer)
+                last_flush = loop.time()
+
+        await self._update_streaming(channels, messages, buffer)
+        for channel in channels:
+            print(f"📨 메시지 전송 완료: 채널 {channel.id}")
+
+    async def _update_streaming(self, channels, messages, text: str):
+        """채널별 현재 메시지를 text로 수정 (없으면 새로 전송)"""
+        if not text.strip():
+            return
+        for channel in channels:
+            try:
+                current = messages.get(channel.id)
+                if current is None:
+                    messages[channel.id] = await channel.send(text)  # type: ignore
+                elif current.content != text:
+                    messages[channel.id] = await current.edit(content=text)
+            except Exception as e:
+                print(f"❌ 채널 {channel.id} 전송 실패: {e}")
+
     def run(self):
         if not self.enabled:
             print("ℹ️  Discord 설정이 유효하지 않아 전송을 생략합니다.")
             return
-        self.client.run(self.token)  # type: ignore
+        try:
+            self.send(self.message)
+        except Exception as e:
+            self.error = e
 
     @staticmethod
     def split_message(content: str, limit: int = 1900):
-        """Discord 2000자 제한을 고려하여 메시지 분할"""
+        """Discord 2000자 제한을 고려하여 메시지 분할 (공백뿐인 조각은 Discord가 거부하므로 제외)"""
+        parts = SimpleDiscordSender._split_at_boundaries(content, limit)
+        return [part.strip() for part in parts if part.strip()]
+
+    @staticmethod
+    def _split_at_boundaries(content: str, limit: int):
+        """limit 이내의 경계에서 자른 원본 조각 목록 (구분자 앞뒤 공백은 그대로 유지)"""
         if len(content) <= limit:
             return [content]
 
-        # 단락 단위 우선 분할
-        paragraphs = content.split("\n\n")
+        # 단락 > 줄 > 공백 순으로 limit 이내의 마지막 경계를 rfind로 찾아 자름
         parts = []
-        buffer = ""
-        for para in paragraphs:
-            candidate = para if not buffer else buffer + "\n\n" + para
-            if len(candidate) <= limit:
-                buffer = candidate
+        start = 0
+        while len(content) - start > limit:
+            end = start + limit
+            for sep in ("\n\n", "\n", " "):
+                cut = content.rfind(sep, start + 1, end + len(sep))
+                if cut > start:
+                    parts.append(content[start:cut])
+                    start = cut + len(sep)
+                    break
             else:
-                if buffer:
-                    parts.append(buffer)
-                # 단락이 자체로도 너무 길면 줄 단위로 분할
-                if len(para) > limit:
-                    lines = para.split("\n")
-                    buf2 = ""
-                    for line in lines:
-                        cand2 = line if not buf2 else buf2 + "\n" + line
-                        if len(cand2) <= limit:
-                            buf2 = cand2
-                        else:
-                            if buf2:
-                                parts.append(buf2)
-                            # 여전히 긴 라인은 강제 자르기
-                            while len(line) > limit:
-                                parts.append(line[:limit])
-                                line = line[limit:]
-                            buf2 = line
-                    if buf2:
-                        parts.append(buf2)
-                    buffer = ""
-                else:
-                    buffer = para
-        if buffer:
-            parts.append(buffer)
+                # 경계가 없는 긴 라인은 강제 자르기
+                parts.append(content[start:end])
+                start = end
+        if start < len(content):
+            parts.append(content[start:])
         return parts
@@ -2,15 +2,22 @@
 LangChain 체인 관리 모듈
 """
 
-from typing import Optional, Dict, Any
+import asyncio
+import hashlib
+from typing import Optional, Dict, Any, Iterator, Tuple
 
 from langchain_ollama.llms import OllamaLLM
 from langchain_core.prompts import PromptTemplate
 
 from .lang_prompt import PromptConfig
+from .lang_template import JobSummaryTemplate
+from .llm_factory import get_llm
 from .mapreduce_chain import MapReduceJobChain
 from .token_counter import SimpleTokenCounter, ContentPreprocessor
 
+# 전처리/토큰 검증 결과를 보관할 최대 공고 수
+_ANALYSIS_CACHE_SIZE = 32
+
 
 class JobSummaryChain:
     """채용공고 요약을 위한 LangChain 관리 클래스"""
@@ -34,8 +41,8 @@ class JobSummaryChain:
         # 프롬프트 설정 관리자
         self.prompt_config = PromptConfig()
 
-        # 기본 체인 생성
-        self.summary_chain = self._create_summary_chain()
+        # 기본 요약 프롬프트를 내용 앞/뒤 고정 문자열로 미리 분리
+        self._prompt_prefix, self._prompt_suffix = self._split_summary_prompt()
 
         # 토큰 카운터 초기화
         self.token_counter = SimpleTokenCounter(max_tokens=max_tokens)
@@ -43,18 +50,42 @@ class JobSummaryChain:
         # Map-Reduce 체인 초기화 (지연 로딩)
         self._mapreduce_chain = None
 
+        # 원문 -> (전처리 결과, 토큰 검증 결과) 캐시 (요약/분석에서 같은 공고 재처리 방지)
+        self._analysis_cache: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+
     def _initialize_llm(self) -> OllamaLLM:
         """Ollama LLM 초기화"""
         try:
-            llm = OllamaLLM(model=self.model_name, temperature=self.temperature)
-            return llm
+            return get_llm(self.model_name, self.temperature)
         except Exception as e:
             raise Exception(f"Ollama LLM 초기화 실패: {e}")
 
-    def _create_summary_chain(self):
-        """채용공고 요약용 체인 생성"""
+    def warm_up(self) -> None:
+        """빈 프롬프트 요청으로 Ollama 모델을 미리 메모리에 로드"""
+        # 응답 캐시에 걸리면 Ollama까지 요청이 가지 않으므로 캐시 없는 사본으로 호출
+        self.llm.model_copy(update={"cache": False}).invoke("")
+
+    def _split_summary_prompt(self) -> Tuple[str, str]:
+        """
+        요약 프롬프트를 job_content 앞/뒤 문자열로 분리
+
+        매 호출마다 Runnable 체인과 템플릿 포맷팅을 거치지 않고
+        문자열 결합만으로 최종 프롬프트를 만들기 위함
+        """
         prompt = self.prompt_config.get_job_summary_prompt()
-        return prompt | self.llm
+        marker = "\x00job_content\x00"
+        prefix, suffix = prompt.format(job_content=marker).split(marker, 1)
+        return prefix, suffix
+
+    def prompt_fingerprint(self) -> str:
+        """요약/Map/Reduce 프롬프트 내용의 해시 (프롬프트가 바뀌면 요약 캐시를 무효화하기 위함)"""
+        parts = (
+            self._prompt_prefix,
+            self._prompt_suffix,
+            JobSummaryTemplate.get_map_template().template,
+            JobSummaryTemplate.get_reduce_template().template,
+        )
+        return hashlib.sha256("\x00".join(parts).encode("utf-8")).hexdigest()
 
     def create_custom_chain(self, custom_prompt: PromptTemplate):
         """커스텀 프롬프트로 새로운 체인 생성"""
@@ -71,59 +102,118 @@ class JobSummaryChain:
         Returns:
             요약된 채용공고 내용
         """
-        try:
-            # 1. 콘텐츠 전처리
-            cleaned_content = ContentPreprocessor.clean_web_content(job_content)
+        return "".join(self.stream_summary(job_content, verbose))
 
-            # 2. 토큰 수 검증
-            validation_result = self.token_counter.validate_content_size(
-                cleaned_content
-            )
+    def stream_summary(self, job_content: str, verbose: bool = False) -> Iterator[str]:
+        """
+        채용공고 요약을 생성되는 대로 조각 단위로 반환 (토큰 제한 자동 처리)
 
-            if verbose:
-                stats = validation_result["stats"]
-                print(f"콘텐츠 분석:")
-                print(f"- 문자 수: {stats.char_count:,}")
-                print(f"- 추정 토큰: {stats.estimated_tokens:,}")
-                print(f"- 권장 처리: {stats.recommended_action}")
+        Args:
+            job_content: 채용공고 원문 내용
+            verbose: 처리 과정 출력 여부
+
+        Yields:
+            요약 결과 조각
+        """
+        try:
+            cleaned_content, validation_result = self._prepare_content(
+                job_content, verbose
+            )
 
-            # 3. 처리 방법 결정
+            # 처리 방법 결정
             if not validation_result["needs_processing"]:
                 # 직접 처리 가능
                 if verbose:
                     print("직접 처리 실행")
-                return self.summary_chain.invoke(input=cleaned_content)
+                yield from self.llm.stream(
+                    self._prompt_prefix + cleaned_content + self._prompt_suffix
+                )
             else:
-                # Map-Reduce 처리 필요
+                # Map-Reduce 처리 필요 (최종 Reduce 결과를 스트리밍)
                 if verbose:
                     print("Map-Reduce 처리 실행")
-                return self._run_mapreduce_summary(cleaned_content, verbose)
+                yield from self._get_mapreduce_chain().stream_large_content(
+                    cleaned_content, verbose
+                )
 
         except Exception as e:
             raise Exception(f"체인 실행 실패: {e}")
 
-    def _run_mapreduce_summary(self, content: str, verbose: bool = False) -> str:
-        """Map-Reduce 방식으로 대용량 콘텐츠 처리"""
+    async def arun_summary(self, job_content: str, verbose: bool = False) -> str:
+        """
+        run_summary의 비동기 버전
+
+        전처리/토큰 검증(CPU 작업)은 별도 스레드에서 실행하여,
+        여러 공고를 처리할 때 다른 공고의 LLM 대기와 겹쳐 진행되도록 한다.
+        """
+        try:
+            cleaned_content, validation_result = await asyncio.to_thread(
+                self._prepare_content, job_content, verbose
+            )
+
+            if not validation_result["needs_processing"]:
+                if verbose:
+                    print("직접 처리 실행")
+                return await self.llm.ainvoke(
+                    self._prompt_prefix + cleaned_content + self._prompt_suffix
+                )
+
+            if verbose:
+                print("Map-Reduce 처리 실행")
+            return await self._get_mapreduce_chain().aprocess_large_content(
+                cleaned_content, verbose
+            )
+
+        except Exception as e:
+            raise Exception(f"체인 실행 실패: {e}")
+
+    def _prepare_content(
+        self, job_content: str, verbose: bool = False
+    ) -> Tuple[str, Dict[str, Any]]:
+        """콘텐츠 전처리 및 토큰 수 검증 결과 반환 (같은 원문은 캐시 사용)"""
+        cached = self._analysis_cache.get(job_content)
+        if cached is not None:
+            cleaned_content, validation_result = cached
+        else:
+            # 1. 콘텐츠 전처리
+            cleaned_content = ContentPreprocessor.clean_web_content(job_content)
+
+            # 2. 토큰 수 검증
+            validation_result = self.token_counter.validate_content_size(
+                cleaned_content
+            )
+
+            # 최대 _ANALYSIS_CACHE_SIZE개까지 보관 (가장 오래된 항목부터 제거)
+            if len(self._analysis_cache) >= _ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.pop(next(iter(self._analysis_cache)))
+            self._analysis_cache[job_content] = (cleaned_content, validation_result)
+
+        if verbose:
+            stats = validation_result["stats"]
+            print(f"콘텐츠 분석:")
+            print(f"- 문자 수: {stats.char_count:,}")
+            print(f"- 추정 토큰: {stats.estimated_tokens:,}")
+            print(f"- 권장 처리: {stats.recommended_action}")
+
+        return cleaned_content, validation_result
+
+    def _get_mapreduce_chain(self) -> MapReduceJobChain:
+        """Map-Reduce 체인 반환 (지연 로딩)"""
         if self._mapreduce_chain is None:
             self._mapreduce_chain = MapReduceJobChain(
                 model_name=self.model_name, temperature=self.temperature
             )
-
-        return self._mapreduce_chain.process_large_content(content, verbose)
+        return self._mapreduce_chain
 
     def get_content_analysis(self, content: str) -> Dict[str, Any]:
         """콘텐츠 분석 정보 반환"""
-        cleaned_content = ContentPreprocessor.clean_web_content(content)
-        validation_result = self.token_counter.validate_content_size(cleaned_content)
+        cleaned_content, validation_result = self._prepare_content(content)
+        # 캐시된 결과가 변경되지 않도록 복사본에 통계 추가
+        validation_result = dict(validation_result)
 
         # Map-Reduce 체인이 필요한 경우 처리 통계 추가
         if validation_result["needs_processing"]:
-            if self._mapreduce_chain is None:
-                self._mapreduce_chain = MapReduceJobChain(
-                    model_name=self.model_name, temperature=self.temperature
-                )
-
-            mapreduce_stats = self._mapreduce_chain.get_processing_stats(
+            mapreduce_stats = self._get_mapreduce_chain().get_processing_stats(
                 cleaned_content
             )
             validation_result["mapreduce_stats"] = mapreduce_stats
@@ -155,6 +245,14 @@ class JobSummaryChain:
         if not 0.0 <= new_temperature <= 1.0:
             raise ValueError("온도는 0.0과 1.0 사이의 값이어야 합니다.")
 
+        if new_temperature == self.temperature:
+            return
+
+        # 공유 인스턴스(get_llm)는 다른 체인도 사용하므로 직접 수정하지 않고
+        # 해당 온도의 인스턴스를 캐시에서 가져옴 (이미 만든 온도면 재생성 없음)
         self.temperature = new_temperature
         self.llm = self._initialize_llm()
-        self.summary_chain = self._create_summary_chain()
+
+        # Map-Reduce 체인도 같은 온도를 쓰도록 동기화
+        if self._mapreduce_chain is not None:
+            self._mapreduce_chain.update_settings(temperature=new_temperature)
@@ -0,0 +1,61 @@
+"""
+LLM 응답 캐시 모듈 - 동일한 (프롬프트, 모델, 설정) 요청의 재추론 방지
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+from langchain_core.caches import BaseCache
+
+LLM_CACHE_PATH = Path("output/.llm_cache.db")
+
+# 캐시 미사용(None)도 유효한 결과이므로 생성 여부는 별도 플래그로 확인
+_llm_cache: Optional[BaseCache] = None
+_llm_cache_ready = False
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[BaseCache]:
+    """
+    OllamaLLM에 연결할 응답 캐시 반환 (프로세스 내에서 한 번만 생성)
+
+    REDIS_URL이 설정되어 있고 redis 패키지가 있으면 Redis 캐시를,
+    아니면 로컬 SQLite 캐시(output/.llm_cache.db)를 사용한다.
+    LLM_CACHE_ENABLED=false 이거나 캐시 생성에 실패하면 None(캐시 미사용)을 반환한다.
+    """
+    global _llm_cache, _llm_cache_ready
+    if _llm_cache_ready:
+        return _llm_cache
+    # 여러 스레드에서 동시에 처음 호출해도 캐시(SQLite 연결)는 하나만 생성
+    with _llm_cache_lock:
+        if not _llm_cache_ready:
+            _llm_cache = _create_llm_cache()
+            _llm_cache_ready = True
+    return _llm_cache
+
+
+def _create_llm_cache() -> Optional[BaseCache]:
+    if os.getenv("LLM_CACHE_ENABLED", "true").lower() == "false":
+        return None
+
+    # langchain_community는 로딩이 무거우므로 캐시 생성 시점에 import
+    redis_url = os.getenv("REDIS_URL")
+    if redis_url:
+        try:
+            import redis
+            from langchain_community.cache import RedisCache
+
+            return RedisCache(redis.Redis.from_url(redis_url))
+        except Exception:
+            # redis 미설치/연결 실패 시 로컬 SQLite 캐시로 대체
+            pass
+
+    try:
+        from langchain_community.cache import SQLiteCache
+
+        LLM_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        return SQLiteCache(database_path=str(LLM_CACHE_PATH))
+    except Exception:
+        return None
@@ -0,0 +1,44 @@
+"""
+OllamaLLM 생성 모듈 - 동일 설정의 LLM 인스턴스를 프로세스 내에서 공유
+"""
+
+import threading
+from functools import lru_cache
+
+from langchain_ollama.llms import OllamaLLM
+
+from .llm_cache import get_llm_cache
+
+# lru_cache는 동시에 들어온 캐시 미스를 직렬화하지 않으므로
+# (워밍업 스레드와 메인 스레드의 동시 호출) 생성 경로를 락으로 보호
+_llm_lock = threading.Lock()
+
+
+def get_llm(
+    model_name: str,
+    temperature: float,
+    num_predict: int = 2048,
+    num_ctx: int = 4096,
+) -> OllamaLLM:
+    """
+    (모델명, 온도, 출력/컨텍스트 토큰 제한)별 OllamaLLM 공유 인스턴스 반환
+
+    요약 체인과 Map-Reduce 체인이 같은 설정이면 같은 인스턴스(HTTP 연결 풀)를 쓰고,
+    온도 변경 등으로 다시 요청해도 이미 만든 인스턴스를 재사용한다.
+    """
+    with _llm_lock:
+        return _build_llm(model_name, temperature, num_predict, num_ctx)
+
+
+@lru_cache(maxsize=8)
+def _build_llm(
+    model_name: str, temperature: float, num_predict: int, num_ctx: int
+) -> OllamaLLM:
+    return OllamaLLM(
+        model=model_name,
+        temperature=temperature,
+        num_predict=num_predict,  # 출력 토큰 상한 (생성 폭주 시 지연 제한)
+        num_ctx=num_ctx,  # 두 체인이 같은 값을 써야 모델 재로드가 없음
+        keep_alive="30m",  # 모델과 프롬프트 KV 캐시를 메모리에 유지
+        cache=get_llm_cache(),  # 동일 프롬프트 응답 재사용
+    )
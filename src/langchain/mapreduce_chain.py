@@ -2,14 +2,64 @@
 Map-Reduce 패턴 기반 대용량 텍스트 처리 체인
 """
 
-from typing import List, Dict, Any, Optional
-from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import asyncio
+import threading
 import time
 
+import httpx
+from langchain_core.runnables import Runnable, RunnableLambda
 from langchain_ollama.llms import OllamaLLM
+from ollama import ResponseError
 
 from .text_splitter import JobPostingSplitter
 from .lang_template import JobSummaryTemplate
+from .llm_factory import get_llm
+
+# 중간 그룹 요약 없이 최종 Reduce에 넘길 수 있는 Map 결과 결합 텍스트 최대 길이
+_REDUCE_INPUT_LIMIT = 8000
+
+# Map 단계 청크별 최대 시도 횟수 (첫 시도 포함)
+_MAP_MAX_ATTEMPTS = 3
+
+
+class _TransientLLMError(Exception):
+    """재시도할 일시적 Ollama 오류 (연결 실패/타임아웃, 5xx 응답)"""
+
+
+def _is_transient(error: Exception) -> bool:
+    """과부하 등으로 다시 시도하면 성공할 수 있는 오류인지 확인 (모델 없음/잘못된 요청은 제외)"""
+    if isinstance(error, ResponseError):
+        return error.status_code >= 500
+    return isinstance(error, (httpx.TransportError, ConnectionError))
+
+
+def _parallel_batch(runnable: Runnable, inputs: List[Any], concurrency: int) -> List[Any]:
+    """
+    입력별 invoke를 스레드 풀에서 최대 concurrency개씩 동시에 실행 (실패는 예외 객체로 반환)
+
+    BaseLLM.batch는 max_concurrency 단위로 나눈 묶음을 generate 한 번으로 넘기고,
+    OllamaLLM은 그 안의 프롬프트를 순차 처리하므로 Runnable 기본 batch 구현을 사용한다.
+    """
+    return Runnable.batch(
+        runnable,
+        inputs,
+        config={"max_concurrency": concurrency},
+        return_exceptions=True,
+    )
+
+
+async def _aparallel_batch(
+    runnable: Runnable, inputs: List[Any], concurrency: int
+) -> List[Any]:
+    """_parallel_batch의 비동기 버전 (입력별 ainvoke를 동시에 실행)"""
+    return await Runnable.abatch(
+        runnable,
+        inputs,
+        config={"max_concurrency": concurrency},
+        return_exceptions=True,
+    )
 
 
 class MapReduceJobChain:
@@ -21,7 +71,7 @@ class MapReduceJobChain:
         temperature: float = 0.1,
         chunk_size: int = 3000,
         chunk_overlap: int = 200,
-        max_workers: int = 3,
+        max_workers: int = 6,
     ):
         """
         Map-Reduce 체인 초기화
@@ -31,12 +81,22 @@ class MapReduceJobChain:
             temperature: LLM 온도 설정
             chunk_size: 청크 최대 크기
             chunk_overlap: 청크 간 겹치는 부분
-            max_workers: 병렬 처리 최대 워커 수
+            max_workers: 병렬 처리 최대 워커 수 (실제 동시성은 측정값에 따라 이 안에서 조절)
         """
         self.model_name = model_name
         self.temperature = temperature
         self.max_workers = max_workers
 
+        # Map 단계 동시성 (AIMD로 조절하며 다음 공고 처리에도 이어서 사용)
+        self._workers = min(3, max_workers)
+        self._best_throughput = 0.0
+        self._window_start = 0.0
+        self._window_done = 0
+        # 마지막 조절 이후 발생한 일시적 오류 수 (재시도로 성공해도 동시성 조절에 반영)
+        # Map 워커 스레드에서 갱신하므로 락으로 보호
+        self._transient_errors = 0
+        self._transient_lock = threading.Lock()
+
         # LLM 초기화
         self.llm = self._initialize_llm()
 
@@ -50,22 +110,57 @@ class MapReduceJobChain:
         self.reduce_template = JobSummaryTemplate.get_reduce_template()
 
         # 체인 생성
-        self.map_chain = self.map_template | self.llm
         self.reduce_chain = self.reduce_template | self.llm
+        self.map_llm = self._build_map_llm()
+
+        # Map 프롬프트를 청크 앞/뒤 고정 문자열로 미리 분리 (청크마다 템플릿 포맷팅 생략)
+        marker = "\x00text\x00"
+        self._map_prefix, self._map_suffix = self.map_template.format(
+            text=marker
+        ).split(marker, 1)
 
     def _initialize_llm(self) -> OllamaLLM:
         """Ollama LLM 초기화"""
         try:
-            return OllamaLLM(
-                model=self.model_name,
-                temperature=self.temperature,
-                num_predict=2048,  # 출력 토큰 제한
-                num_ctx=4096,  # 컨텍스트 토큰 제한
-                timeout=120,  # 타임아웃 설정
-            )
+            return get_llm(self.model_name, self.temperature)
         except Exception as e:
             raise Exception(f"Ollama LLM 초기화 실패: {e}")
 
+    def _build_map_llm(self) -> Runnable:
+        """
+        Map 단계용 재시도 래퍼 (일시적인 Ollama 과부하로 청크가 빠지지 않도록)
+
+        일시적 오류만 약 2초, 4초 ... 지수 백오프(지터 포함)로 최대 _MAP_MAX_ATTEMPTS회 시도하고,
+        모델 없음/잘못된 요청 같은 영구 오류는 바로 실패로 돌려준다.
+        """
+        llm = self.llm
+
+        def to_transient(error: Exception) -> Exception:
+            if not _is_transient(error):
+                return error
+            with self._transient_lock:
+                self._transient_errors += 1
+            return _TransientLLMError(str(error))
+
+        def invoke(prompt: str, config) -> str:
+            try:
+                return llm.invoke(prompt, config)
+            except Exception as e:
+                raise to_transient(e) from e
+
+        async def ainvoke(prompt: str, config) -> str:
+            try:
+                return await llm.ainvoke(prompt, config)
+            except Exception as e:
+                raise to_transient(e) from e
+
+        return RunnableLambda(invoke, afunc=ainvoke).with_retry(
+            retry_if_exception_type=(_TransientLLMError,),
+            stop_after_attempt=_MAP_MAX_ATTEMPTS,
+            wait_exponential_jitter=True,
+            exponential_jitter_params={"initial": 2},
+        )
+
     def process_large_content(self, content: str, verbose: bool = False) -> str:
         """
         대용량 콘텐츠를 Map-Reduce 방식으로 처리
@@ -77,6 +172,44 @@ class MapReduceJobChain:
         Returns:
             최종 요약 결과
         """
+        reduce_input = self._prepare_reduce_input(content, verbose)
+
+        try:
+            start_time = time.time()
+            final_result = self.reduce_chain.invoke({"text": reduce_input})
+
+            if verbose:
+                elapsed = time.time() - start_time
+                print(f"Reduce 단계 처리 시간: {elapsed:.2f}초")
+                print("Map-Reduce 처리 완료")
+
+            return final_result
+        except Exception as e:
+            raise Exception(f"Reduce 단계 실패: {e}")
+
+    def stream_large_content(self, content: str, verbose: bool = False) -> Iterator[str]:
+        """
+        대용량 콘텐츠를 Map-Reduce 방식으로 처리하되 최종 Reduce 결과는 스트리밍
+
+        Args:
+            content: 처리할 콘텐츠
+            verbose: 진행 상황 출력 여부
+
+        Yields:
+            최종 요약 결과 조각
+        """
+        reduce_input = self._prepare_reduce_input(content, verbose)
+        yield from self.stream_reduce(reduce_input)
+
+    def stream_reduce(self, text: str) -> Iterator[str]:
+        """최종 Reduce 결과를 생성되는 대로 반환"""
+        try:
+            yield from self.reduce_chain.stream({"text": text})
+        except Exception as e:
+            raise Exception(f"Reduce 단계 실패: {e}")
+
+    def _prepare_reduce_input(self, content: str, verbose: bool = False) -> str:
+        """분할 + Map 단계를 수행하여 최종 Reduce에 넣을 텍스트 반환"""
         if verbose:
             print(f"원본 콘텐츠 크기: {len(content):,} 문자")
 
@@ -89,11 +222,11 @@ class MapReduceJobChain:
                 f"평균 청크 크기: {sum(len(c) for c in chunks) // len(chunks):,} 문자"
             )
 
-        # 단일 청크인 경우 직접 처리
+        # 단일 청크인 경우 Map 없이 바로 Reduce 템플릿으로 처리
         if len(chunks) == 1:
             if verbose:
                 print("단일 청크 - 직접 처리")
-            return self._process_single_chunk(chunks[0])
+            return chunks[0]
 
         # 2. Map 단계 - 각 청크 요약
         if verbose:
@@ -104,131 +237,243 @@ class MapReduceJobChain:
         if verbose:
             print(f"Map 단계 완료 - {len(map_results)}개 요약 생성")
 
-        # 3. Reduce 단계 - 요약들을 통합
+        # 3. Reduce 단계 준비 - 요약들을 통합
         if verbose:
             print("Reduce 단계 시작...")
 
-        final_result = self._execute_reduce_phase(map_results, verbose)
+        return self._build_reduce_input(map_results, verbose)
+
+    async def aprocess_large_content(self, content: str, verbose: bool = False) -> str:
+        """
+        대용량 콘텐츠를 Map-Reduce 방식으로 비동기 처리
+
+        Args:
+            content: 처리할 콘텐츠
+            verbose: 진행 상황 출력 여부
+
+        Returns:
+            최종 요약 결과
+        """
+        chunks = self.text_splitter.split_job_posting(content)
 
         if verbose:
-            print("Map-Reduce 처리 완료")
+            print(f"분할된 청크 수: {len(chunks)}")
 
-        return final_result
+        if len(chunks) == 1:
+            reduce_input = chunks[0]
+        else:
+            map_results = await self._aexecute_map_phase(chunks, verbose)
+            reduce_input = await self._abuild_reduce_input(map_results, verbose)
 
-    def _process_single_chunk(self, chunk: str) -> str:
-        """단일 청크 처리"""
         try:
-            # 단일 청크는 reduce 템플릿 사용
-            return self.reduce_chain.invoke({"text": chunk})
+            return await self.reduce_chain.ainvoke({"text": reduce_input})
         except Exception as e:
-            raise Exception(f"단일 청크 처리 실패: {e}")
+            raise Exception(f"Reduce 단계 실패: {e}")
 
     def _execute_map_phase(self, chunks: List[str], verbose: bool = False) -> List[str]:
-        """Map 단계 실행 - 각 청크를 병렬로 요약"""
-        results = []
+        """Map 단계 실행 - 측정된 동시성만큼 청크를 동시에 요약 (하나가 끝나면 바로 다음 청크 투입)"""
+        start_time = time.time()
+        prompts = self._map_prompts(chunks)
+        outputs: List[Any] = [None] * len(prompts)
+        self._start_tuning_window()
 
-        # 병렬 처리로 Map 단계 실행
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = []
-
-            for i, chunk in enumerate(chunks):
-                future = executor.submit(self._process_map_chunk, chunk, i, verbose)
-                futures.append(future)
-
-            # 결과 수집
-            for i, future in enumerate(futures):
-                try:
-                    result = future.result(timeout=180)  # 3분 타임아웃
-                    results.append(result)
-                    if verbose:
-                        print(f"청크 {i+1}/{len(chunks)} 처리 완료")
-                except Exception as e:
-                    error_msg = f"청크 {i+1} 처리 실패: {e}"
-                    if verbose:
-                        print(error_msg)
-                    results.append(f"[처리 실패: {error_msg}]")
+            running = {}
+            next_idx = 0
+            while running or next_idx < len(prompts):
+                while next_idx < len(prompts) and len(running) < self._workers:
+                    future = executor.submit(self.map_llm.invoke, prompts[next_idx])
+                    running[future] = next_idx
+                    next_idx += 1
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    idx = running.pop(future)
+                    error = future.exception()
+                    outputs[idx] = error if error is not None else future.result()
+                    self._tune_workers(error is not None, next_idx < len(prompts), verbose)
 
-        return results
+        if verbose:
+            elapsed = time.time() - start_time
+            print(f"Map 단계 처리 시간: {elapsed:.2f}초")
+
+        return self._collect_map_results(outputs, verbose)
+
+    async def _aexecute_map_phase(
+        self, chunks: List[str], verbose: bool = False
+    ) -> List[str]:
+        """Map 단계 비동기 실행 - _execute_map_phase와 같은 방식으로 청크를 동시에 요약"""
+        start_time = time.time()
+        prompts = self._map_prompts(chunks)
+        outputs: List[Any] = [None] * len(prompts)
+        self._start_tuning_window()
+
+        running = {}
+        next_idx = 0
+        while running or next_idx < len(prompts):
+            while next_idx < len(prompts) and len(running) < self._workers:
+                task = asyncio.ensure_future(self.map_llm.ainvoke(prompts[next_idx]))
+                running[task] = next_idx
+                next_idx += 1
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                idx = running.pop(task)
+                error = task.exception()
+                outputs[idx] = error if error is not None else task.result()
+                self._tune_workers(error is not None, next_idx < len(prompts), verbose)
 
-    def _process_map_chunk(
-        self, chunk: str, chunk_idx: int, verbose: bool = False
-    ) -> str:
-        """개별 청크 처리 (Map 단계)"""
-        try:
-            start_time = time.time()
-            result = self.map_chain.invoke({"text": chunk})
+        if verbose:
+            elapsed = time.time() - start_time
+            print(f"Map 단계 처리 시간: {elapsed:.2f}초")
 
-            if verbose:
-                elapsed = time.time() - start_time
-                print(f"청크 {chunk_idx+1} 처리 시간: {elapsed:.2f}초")
+        return self._collect_map_results(outputs, verbose)
 
-            return result
-        except Exception as e:
-            raise Exception(f"청크 {chunk_idx+1} Map 처리 실패: {e}")
+    def _start_tuning_window(self):
+        """처리량 측정 구간 초기화"""
+        self._window_start = time.time()
+        self._window_done = 0
 
-    def _execute_reduce_phase(
-        self, map_results: List[str], verbose: bool = False
-    ) -> str:
-        """Reduce 단계 실행 - 요약들을 최종 통합"""
-        try:
-            start_time = time.time()
+    def _tune_workers(self, failed: bool, saturated: bool, verbose: bool = False):
+        """
+        청크 하나가 끝날 때마다 동시성 조절 (AIMD)
 
-            # 모든 Map 결과를 하나의 텍스트로 결합
-            combined_text = "\n\n".join(
-                [
-                    f"=== 요약 {i+1} ===\n{result}"
-                    for i, result in enumerate(map_results)
-                ]
-            )
+        실패나 일시적 오류(재시도로 성공한 경우 포함)가 있으면 절반으로 줄이고,
+        현재 동시성만큼 처리될 때마다 그 구간의 처리량(청크/초)이 이전 최고치보다 좋아지면 1 늘린다.
+        처리량이 떨어지면 서버에서 대기열이 생긴 것으로 보고 1 줄인다.
 
-            # 결합된 텍스트가 너무 긴 경우 재귀적으로 처리
-            if len(combined_text) > 8000:  # 임계값
+        Args:
+            failed: 방금 끝난 청크의 실패 여부
+            saturated: 대기 중인 청크가 남아 있어 동시성을 모두 채워 실행 중이었는지 여부
+        """
+        workers = self._workers
+        with self._transient_lock:
+            transient_errors, self._transient_errors = self._transient_errors, 0
+        if failed or transient_errors:
+            self._workers = max(1, workers // 2)
+            self._best_throughput = 0.0
+            self._start_tuning_window()
+        elif saturated:
+            # 남은 청크가 없어 동시 실행 수가 줄어드는 마지막 구간은 처리량이 낮게 나오므로 제외
+            self._window_done += 1
+            elapsed = time.time() - self._window_start
+            if self._window_done >= workers and elapsed > 0:
+                throughput = self._window_done / elapsed
+                if throughput > self._best_throughput * 1.05:
+                    self._best_throughput = throughput
+                    self._workers = min(self.max_workers, workers + 1)
+                elif throughput < self._best_throughput * 0.9:
+                    self._workers = max(1, workers - 1)
+                self._start_tuning_window()
+
+        if verbose and self._workers != workers:
+            print(f"Map 동시성 조절: {workers} → {self._workers}")
+
+    def _map_prompts(self, chunks: List[str]) -> List[str]:
+        """청크별 Map 프롬프트 생성 (고정 접두/접미 문자열 결합)"""
+        return [f"{self._map_prefix}{chunk}{self._map_suffix}" for chunk in chunks]
+
+    def _collect_map_results(self, outputs: List[Any], verbose: bool = False) -> List[str]:
+        """batch 결과 정리 - 실패한 청크는 실패 메시지로 대체"""
+        results = []
+
+        for i, output in enumerate(outputs):
+            if isinstance(output, Exception):
+                error_msg = f"청크 {i+1} 처리 실패: {output}"
                 if verbose:
-                    print("Reduce 단계 텍스트가 너무 김 - 재귀 처리")
+                    print(error_msg)
+                results.append(f"[처리 실패: {error_msg}]")
+            else:
+                if verbose:
+                    print(f"청크 {i+1}/{len(outputs)} 처리 완료")
+                results.append(output)
 
-                # Map 결과들을 다시 청크로 나누어 처리
-                return self._recursive_reduce(map_results, verbose)
+        return results
 
-            # 최종 통합 요약
-            final_result = self.reduce_chain.invoke({"text": combined_text})
+    def _build_reduce_input(self, map_results: List[str], verbose: bool = False) -> str:
+        """최종 Reduce 입력 텍스트 생성 - 너무 길면 중간 그룹 요약을 반복"""
+        combined_text = self._combine_map_results(map_results)
+        if combined_text is not None:
+            return combined_text
 
-            if verbose:
-                elapsed = time.time() - start_time
-                print(f"Reduce 단계 처리 시간: {elapsed:.2f}초")
+        if verbose:
+            print("Reduce 단계 텍스트가 너무 김 - 재귀 처리")
 
-            return final_result
+        # Map 결과들을 그룹 단위로 반복 요약하여 2개 이하로 축소
+        summaries = map_results
+        while len(summaries) > 2:
+            summaries = self._reduce_groups(summaries, verbose)
 
-        except Exception as e:
-            raise Exception(f"Reduce 단계 실패: {e}")
+        return "\n\n".join(summaries)
 
-    def _recursive_reduce(self, summaries: List[str], verbose: bool = False) -> str:
-        """재귀적 Reduce - 요약이 너무 많은 경우"""
-        if len(summaries) <= 2:
-            combined = "\n\n".join(summaries)
-            return self.reduce_chain.invoke({"text": combined})
+    async def _abuild_reduce_input(
+        self, map_results: List[str], verbose: bool = False
+    ) -> str:
+        """_build_reduce_input의 비동기 버전 - 각 단계의 그룹 요약을 abatch로 병렬 실행"""
+        combined_text = self._combine_map_results(map_results)
+        if combined_text is not None:
+            return combined_text
 
-        # 요약들을 그룹으로 나누어 처리
-        group_size = 3
-        intermediate_results = []
+        if verbose:
+            print("Reduce 단계 텍스트가 너무 김 - 재귀 처리")
 
-        for i in range(0, len(summaries), group_size):
-            group = summaries[i : i + group_size]
-            combined = "\n\n".join(group)
+        summaries = map_results
+        while len(summaries) > 2:
+            summaries = await self._areduce_groups(summaries, verbose)
 
-            try:
-                result = self.reduce_chain.invoke({"text": combined})
-                intermediate_results.append(result)
+        return "\n\n".join(summaries)
 
-                if verbose:
-                    print(f"중간 그룹 {i//group_size + 1} 처리 완료")
+    @staticmethod
+    def _combine_map_results(map_results: List[str]) -> Optional[str]:
+        """모든 Map 결과를 하나의 텍스트로 결합 (임계값을 넘으면 None)"""
+        # 결과 본문 길이만으로 임계값을 넘으면 결합 문자열을 만들지 않고 바로 반환
+        if sum(map(len, map_results)) > _REDUCE_INPUT_LIMIT:
+            return None
 
-            except Exception as e:
+        combined_text = "\n\n".join(
+            [f"=== 요약 {i+1} ===\n{result}" for i, result in enumerate(map_results)]
+        )
+        if len(combined_text) <= _REDUCE_INPUT_LIMIT:
+            return combined_text
+        return None
+
+    @staticmethod
+    def _group_summaries(summaries: List[str], group_size: int = 3) -> List[Dict[str, str]]:
+        """요약들을 group_size개씩 묶어 Reduce 체인 입력으로 변환"""
+        return [
+            {"text": "\n\n".join(summaries[i : i + group_size])}
+            for i in range(0, len(summaries), group_size)
+        ]
+
+    def _reduce_groups(self, summaries: List[str], verbose: bool = False) -> List[str]:
+        """요약들을 그룹으로 나누어 병렬로 중간 요약"""
+        outputs = _parallel_batch(
+            self.reduce_chain, self._group_summaries(summaries), self._workers
+        )
+        return self._collect_group_results(outputs, verbose)
+
+    async def _areduce_groups(
+        self, summaries: List[str], verbose: bool = False
+    ) -> List[str]:
+        """요약들을 그룹으로 나누어 abatch로 병렬 중간 요약"""
+        outputs = await _aparallel_batch(
+            self.reduce_chain, self._group_summaries(summaries), self._workers
+        )
+        return self._collect_group_results(outputs, verbose)
+
+    def _collect_group_results(self, outputs: List[Any], verbose: bool = False) -> List[str]:
+        """중간 그룹 요약 결과 정리 - 실패한 그룹은 오류 메시지로 대체"""
+        intermediate_results = []
+
+        for i, output in enumerate(outputs):
+            if isinstance(output, Exception):
+                if verbose:
+                    print(f"중간 그룹 {i + 1} 처리 실패: {output}")
+                intermediate_results.append(f"[그룹 처리 실패: {output}]")
+            else:
                 if verbose:
-                    print(f"중간 그룹 {i//group_size + 1} 처리 실패: {e}")
-                intermediate_results.append(f"[그룹 처리 실패: {e}]")
+                    print(f"중간 그룹 {i + 1} 처리 완료")
+                intermediate_results.append(output)
 
-        # 재귀적으로 중간 결과들을 다시 결합
-        return self._recursive_reduce(intermediate_results, verbose)
+        return intermediate_results
 
     def get_processing_stats(self, content: str) -> Dict[str, Any]:
         """처리 예상 통계 정보 반환"""
@@ -241,7 +486,7 @@ class MapReduceJobChain:
                 sum(len(c) for c in chunks) // len(chunks) if chunks else 0
             ),
             "estimated_processing_time": len(chunks) * 10,  # 청크당 10초 예상
-            "recommended_max_workers": min(len(chunks), self.max_workers),
+            "recommended_max_workers": min(len(chunks), self._workers),
             "chunk_sizes": [len(c) for c in chunks],
         }
 
@@ -261,9 +506,10 @@ class MapReduceJobChain:
 
         if max_workers is not None:
             self.max_workers = max_workers
+            self._workers = min(self._workers, max_workers)
 
         if temperature is not None:
             self.temperature = temperature
             self.llm = self._initialize_llm()
-            self.map_chain = self.map_template | self.llm
             self.reduce_chain = self.reduce_template | self.llm
+            self.map_llm = self._build_map_llm()
@@ -5,6 +5,14 @@
 import re
 from typing import List, Optional
 
+# 전처리용 정규식 (호출마다 컴파일/캐시 조회하지 않도록 모듈 로드 시 한 번만 컴파일)
+_WS_RE = re.compile(r'\s+')
+_NL_RE = re.compile(r'\n\s*\n')
+_HTML_RE = re.compile(r'<[^>]+>')
+# 허용 문자 외 특수 문자: str.translate 테이블은 비ASCII 문자마다 매핑 조회가 일어나
+# 한글 위주 텍스트에서 이 정규식 한 번보다 빠르지 않으므로 정규식을 유지
+_SPECIAL_RE = re.compile(r'[^\w\s가-힣.,!?()[\]{}:;-]')
+
 
 class SmartTextSplitter:
     """토큰 제한을 고려한 스마트 텍스트 분할기"""
@@ -39,12 +47,13 @@ class SmartTextSplitter:
             ""       # 문자 단위
         ]
     
-    def split_text(self, text: str) -> List[str]:
+    def split_text(self, text: str, _preprocessed: bool = False) -> List[str]:
         """
         텍스트를 청크로 분할
         
         Args:
             text: 분할할 텍스트
+            _preprocessed: 호출 측에서 이미 공백/줄바꿈 정리를 마친 경우 True
             
         Returns:
             분할된 텍스트 청크 리스트
@@ -52,35 +61,41 @@ class SmartTextSplitter:
         if len(text) <= self.chunk_size:
             return [text]
         
-        # 기본 전처리
-        text = self._preprocess_text(text)
+        # 기본 전처리 (이미 정리된 텍스트면 같은 정규식을 다시 돌리지 않음)
+        if not _preprocessed:
+            text = self._preprocess_text(text)
         
         chunks = []
-        current_chunk = ""
+        # 문자열 += 반복 복사를 피하기 위해 리스트에 모은 뒤 한 번에 join
+        cur_buf: List[str] = []
+        cur_len = 0
         
         # 우선순위별 구분자로 분할 시도
         segments = self._split_by_separators(text)
         
         for segment in segments:
             # 현재 청크에 추가 가능한지 확인
-            if len(current_chunk) + len(segment) <= self.chunk_size:
-                current_chunk += segment
+            if cur_len + len(segment) <= self.chunk_size:
+                cur_buf.append(segment)
+                cur_len += len(segment)
             else:
                 # 현재 청크가 비어있지 않으면 저장
-                if current_chunk.strip():
-                    chunks.append(current_chunk.strip())
+                current_chunk = ''.join(cur_buf).strip()
+                if current_chunk:
+                    chunks.append(current_chunk)
                 
                 # 세그먼트가 청크 크기보다 큰 경우 강제 분할
                 if len(segment) > self.chunk_size:
                     force_split_chunks = self._force_split(segment)
                     chunks.extend(force_split_chunks[:-1])
-                    current_chunk = force_split_chunks[-1] if force_split_chunks else ""
-                else:
-                    current_chunk = segment
+                    segment = force_split_chunks[-1] if force_split_chunks else ""
+                cur_buf = [segment]
+                cur_len = len(segment)
         
         # 마지막 청크 추가
-        if current_chunk.strip():
-            chunks.append(current_chunk.strip())
+        current_chunk = ''.join(cur_buf).strip()
+        if current_chunk:
+            chunks.append(current_chunk)
         
         # 오버랩 적용
         return self._apply_overlap(chunks)
@@ -88,28 +103,30 @@ class SmartTextSplitter:
     def _preprocess_text(self, text: str) -> str:
         """텍스트 전처리"""
         # 연속된 공백 제거
-        text = re.sub(r'\s+', ' ', text)
+        text = _WS_RE.sub(' ', text)
         # 연속된 줄바꿈 정리
-        text = re.sub(r'\n\s*\n', '\n\n', text)
+        text = _NL_RE.sub('\n\n', text)
         return text.strip()
     
     def _split_by_separators(self, text: str) -> List[str]:
         """구분자 우선순위에 따라 텍스트 분할"""
         for separator in self.separators:
-            if separator in text:
-                if separator == "":
-                    # 문자 단위 분할
-                    return list(text)
-                else:
-                    parts = text.split(separator)
-                    # 구분자도 포함하여 재구성
-                    result = []
-                    for i, part in enumerate(parts):
-                        if i < len(parts) - 1:
-                            result.append(part + separator)
-                        else:
-                            result.append(part)
-                    return [p for p in result if p.strip()]
+            if separator == "":
+                # 문자 단위 대신 청크 크기로 바로 잘라 문자별 객체 생성을 피함
+                return [
+                    text[i:i + self.chunk_size]
+                    for i in range(0, len(text), self.chunk_size)
+                ]
+            
+            # `in` 검사 없이 바로 분할하고, 구분자가 없으면(조각 1개) 다음 구분자로
+            parts = text.split(separator)
+            if len(parts) == 1:
+                continue
+            
+            # 구분자도 포함하여 재구성
+            result = [part + separator for part in parts[:-1]]
+            result.append(parts[-1])
+            return [p for p in result if p.strip()]
         
         return [text]
     
@@ -144,22 +161,20 @@ class SmartTextSplitter:
             return chunks
         
         overlapped_chunks = [chunks[0]]
+        overlap = self.chunk_overlap
         
-        for i in range(1, len(chunks)):
-            prev_chunk = chunks[i-1]
-            current_chunk = chunks[i]
-            
-            # 이전 청크의 끝부분을 현재 청크 앞에 추가
-            if len(prev_chunk) > self.chunk_overlap:
-                overlap_text = prev_chunk[-self.chunk_overlap:]
-                # 단어 경계에서 자르기
-                space_idx = overlap_text.find(' ')
-                if space_idx > 0:
-                    overlap_text = overlap_text[space_idx+1:]
-                
-                current_chunk = overlap_text + " " + current_chunk
+        for prev_chunk, current_chunk in zip(chunks, chunks[1:]):
+            # 이전 청크가 오버랩보다 짧으면 덧붙일 내용이 없음
+            if len(prev_chunk) <= overlap:
+                overlapped_chunks.append(current_chunk)
+                continue
             
-            overlapped_chunks.append(current_chunk)
+            # 이전 청크의 끝부분을 단어 경계에서 잘라 현재 청크 앞에 추가 (한 번의 결합)
+            overlap_text = prev_chunk[-overlap:]
+            space_idx = overlap_text.find(' ')
+            if space_idx > 0:
+                overlap_text = overlap_text[space_idx + 1:]
+            overlapped_chunks.append(f"{overlap_text} {current_chunk}")
         
         return overlapped_chunks
     
@@ -202,21 +217,21 @@ class JobPostingSplitter(SmartTextSplitter):
         Returns:
             의미 단위로 분할된 청크 리스트
         """
-        # 채용공고 특화 전처리
+        # 채용공고 특화 전처리 (공백/줄바꿈 정리까지 포함하므로 split_text의 전처리는 생략)
         content = self._preprocess_job_content(content)
         
-        return self.split_text(content)
+        return self.split_text(content, _preprocessed=True)
     
     def _preprocess_job_content(self, content: str) -> str:
         """채용공고 전용 전처리"""
         # HTML 태그 잔여물 제거
-        content = re.sub(r'<[^>]+>', '', content)
+        content = _HTML_RE.sub('', content)
         
         # 특수 문자 정리
-        content = re.sub(r'[^\w\s가-힣.,!?()[\]{}:;-]', ' ', content)
+        content = _SPECIAL_RE.sub(' ', content)
         
         # 연속된 공백/줄바꿈 정리
-        content = re.sub(r'\s+', ' ', content)
-        content = re.sub(r'\n\s*\n', '\n\n', content)
+        content = _WS_RE.sub(' ', content)
+        content = _NL_RE.sub('\n\n', content)
         
         return content.strip()
\ No newline at end of file
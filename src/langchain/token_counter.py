@@ -3,9 +3,77 @@
 """
 
 import re
+import string
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 
+# 정규식은 모듈 로드 시 한 번만 컴파일 (호출마다 re 내부 캐시 조회 생략)
+_KOREAN_RE = re.compile(r'[가-힣]')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+_SPECIAL_RE = re.compile(r'[^\w\s가-힣.,!?()[\]{}:;/-]')
+
+# 채용공고에서 중요한 키워드들
+_IMPORTANT_KEYWORDS = [
+    # 한국어
+    '채용', '모집', '지원', '자격', '요건', '우대', '업무', '담당',
+    '복지', '혜택', '급여', '연봉', '마감', '접수', '회사', '소개',
+    '비전', '미션', '사업', '서비스', '기술', '개발', '경력', '신입',
+    # 영어
+    'requirements', 'qualifications', 'responsibilities', 'benefits',
+    'salary', 'experience', 'skills', 'company', 'about', 'mission',
+    'vision', 'role', 'position', 'job', 'career', 'apply', 'deadline'
+]
+
+# 키워드 포함 여부를 라인당 정규식 한 번으로 검사 (키워드별 `in` 반복 대신)
+_KEYWORD_RE = re.compile('|'.join(map(re.escape, _IMPORTANT_KEYWORDS)))
+
+# 이보다 긴 텍스트는 numpy 코드포인트 배열로 비율 계산 (짧으면 배열 생성 비용이 더 큼)
+_NUMPY_RATIO_MIN_LEN = 4096
+
+# ASCII 영문자를 제외한 모든 바이트 (bytes.translate로 지우고 남은 길이 = 영문자 수)
+_NON_ASCII_LETTERS = bytes(b for b in range(256) if chr(b) not in string.ascii_letters)
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    """
+    tiktoken 인코더 반환 (기본 모델 gpt-oss와 같은 o200k 어휘)
+
+    미설치이거나 어휘 파일을 내려받을 수 없으면 None을 반환하며,
+    이 경우 문자 수 기반 추정으로 대체한다.
+    tiktoken은 무거우므로 모듈 로드 시점이 아니라 첫 토큰 계산 때 import한다.
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=1)
+def _get_numpy():
+    """numpy 모듈 반환 (미설치 시 None, 시작 시간 단축을 위해 긴 텍스트 처리 때 처음 import)"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+@lru_cache(maxsize=64)
+def _cached_token_count(text: str, chars_per_token: float) -> int:
+    """
+    (텍스트, 토큰당 문자 수)별 토큰 수 캐시
+
+    문자열 해시는 객체에 한 번만 계산되어 저장되므로 같은 문자열 재조회 비용이 작다.
+    """
+    return SimpleTokenCounter(chars_per_token=chars_per_token)._estimate_tokens(text)
+
 
 @dataclass
 class TokenStats:
@@ -18,7 +86,7 @@ class TokenStats:
 
 
 class SimpleTokenCounter:
-    """간단한 토큰 카운터 (외부 라이브러리 없이)"""
+    """간단한 토큰 카운터 (tiktoken 사용 가능 시 실제 토크나이저로 계산)"""
     
     def __init__(self, chars_per_token: float = 3.5, max_tokens: int = 4096):
         """
@@ -44,6 +112,15 @@ class SimpleTokenCounter:
         if not text:
             return 0
         
+        # 같은 텍스트는 요약/분석 과정에서 여러 번 계산되므로 결과를 캐시
+        return _cached_token_count(text, self.chars_per_token)
+    
+    def _estimate_tokens(self, text: str) -> int:
+        """토큰 수 계산 (tiktoken 또는 문자/단어 수 기반 추정)"""
+        encoding = _get_encoding()
+        if encoding is not None:
+            return len(encoding.encode(text, disallowed_special=()))
+        
         # 기본 문자 수 기반 계산
         char_count = len(text)
         basic_estimate = char_count / self.chars_per_token
@@ -68,8 +145,23 @@ class SimpleTokenCounter:
         if not text:
             return 0.0
         
-        korean_chars = len(re.findall(r'[가-힣]', text))
-        total_chars = len(re.findall(r'[가-힣a-zA-Z]', text))
+        np = _get_numpy() if len(text) > _NUMPY_RATIO_MIN_LEN else None
+        if np is not None:
+            # 코드포인트 배열에서 범위 비교로 한 번에 계산
+            cp = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+            korean_chars = int(np.count_nonzero((cp >= 0xAC00) & (cp <= 0xD7A3)))
+            ascii_letters = int(np.count_nonzero(
+                ((cp >= 0x41) & (cp <= 0x5A)) | ((cp >= 0x61) & (cp <= 0x7A))
+            ))
+            total_chars = korean_chars + ascii_letters
+            return korean_chars / total_chars if total_chars else 0.0
+        
+        # 정규식 탐색은 한글에만 사용하고, 영문자는 C 레벨 bytes 연산으로 계산
+        korean_chars = len(_KOREAN_RE.findall(text))
+        ascii_letters = len(
+            text.encode('ascii', 'ignore').translate(None, _NON_ASCII_LETTERS)
+        )
+        total_chars = korean_chars + ascii_letters
         
         if total_chars == 0:
             return 0.0
@@ -135,14 +227,13 @@ class ContentPreprocessor:
     def clean_web_content(content: str) -> str:
         """웹 콘텐츠 정리"""
         # HTML 태그 제거
-        content = re.sub(r'<[^>]+>', '', content)
+        content = _HTML_TAG_RE.sub('', content)
         
-        # 연속된 공백/줄바꿈 정리
-        content = re.sub(r'\s+', ' ', content)
-        content = re.sub(r'\n\s*\n', '\n\n', content)
+        # 연속된 공백/줄바꿈 정리 (줄바꿈까지 공백 하나로 합치므로 빈 줄 정리는 별도로 불필요)
+        content = _WS_RE.sub(' ', content)
         
         # 특수 문자 정리 (채용공고에 불필요한 것들)
-        content = re.sub(r'[^\w\s가-힣.,!?()[\]{}:;/-]', ' ', content)
+        content = _SPECIAL_RE.sub(' ', content)
         
         # 반복되는 패턴 제거 (광고, 푸터 등)
         content = ContentPreprocessor._remove_repetitive_patterns(content)
@@ -152,42 +243,29 @@ class ContentPreprocessor:
     @staticmethod
     def _remove_repetitive_patterns(content: str) -> str:
         """반복되는 패턴 제거"""
-        lines = content.split('\n')
+        # 한 줄짜리 텍스트(clean_web_content는 공백 정리 후 줄바꿈이 남지 않음)는 반복 검사 불필요
+        if '\n' not in content:
+            return content.strip()
         
-        # 3번 이상 반복되는 라인 제거
+        # 3번 이상 반복되는 라인 제거 (최대 2번까지만 허용)
         seen_lines = {}
         filtered_lines = []
         
-        for line in lines:
+        for line in content.split('\n'):
             line = line.strip()
             if not line:
                 continue
-                
-            if line in seen_lines:
-                seen_lines[line] += 1
-                if seen_lines[line] <= 2:  # 최대 2번까지만 허용
-                    filtered_lines.append(line)
-            else:
-                seen_lines[line] = 1
+            
+            count = seen_lines.get(line, 0)
+            if count < 2:
                 filtered_lines.append(line)
+            seen_lines[line] = count + 1
         
         return '\n'.join(filtered_lines)
     
     @staticmethod
     def extract_key_sections(content: str) -> str:
         """핵심 섹션만 추출"""
-        # 채용공고에서 중요한 키워드들
-        important_keywords = [
-            # 한국어
-            '채용', '모집', '지원', '자격', '요건', '우대', '업무', '담당',
-            '복지', '혜택', '급여', '연봉', '마감', '접수', '회사', '소개',
-            '비전', '미션', '사업', '서비스', '기술', '개발', '경력', '신입',
-            # 영어
-            'requirements', 'qualifications', 'responsibilities', 'benefits',
-            'salary', 'experience', 'skills', 'company', 'about', 'mission',
-            'vision', 'role', 'position', 'job', 'career', 'apply', 'deadline'
-        ]
-        
         lines = content.split('\n')
         important_lines = []
         
@@ -197,8 +275,7 @@ class ContentPreprocessor:
                 continue
             
             # 중요 키워드가 포함된 라인 우선 선택
-            line_lower = line.lower()
-            if any(keyword in line_lower for keyword in important_keywords):
+            if _KEYWORD_RE.search(line.lower()):
                 important_lines.append(line)
             elif len(line) > 20:  # 너무 짧은 라인 제외
                 important_lines.append(line)
@@ -1,27 +1,207 @@
 # 기존에는 브라우저를 따라하는 형태로 헤더를 보냈지만
 # 정확히 봇임을 명시하도록 수정
-from bs4 import BeautifulSoup
-from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
+import codecs
+import hashlib
+import json
+import os
 import re
-import requests
-from requests.adapters import HTTPAdapter
-
-
-def _build_requests_session() -> requests.Session:
-    """네트워크 요청 실패시 재요청 하는 함수"""
-    session = requests.Session()
-    retries = Retry(
-        total=4,
-        backoff_factor=0.8,
-        status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["GET", "HEAD"],
-        raise_on_status=False,
-    )
-    adapter = HTTPAdapter(max_retries=retries, pool_connections=10, pool_maxsize=10)
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
-    return session
+import threading
+import time
+
+import httpx
+
+try:
+    # C 기반 lexbor 파서 (BeautifulSoup html.parser 대비 수 배 빠름)
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
+
+try:
+    # selectolax가 없을 때는 lxml로 직접 텍스트 추출 (BeautifulSoup 순회 생략)
+    import lxml.html as lxml_html
+except ImportError:
+    lxml_html = None
+
+RAW_DIR = Path("output/raw")
+
+_META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset=["']?([\w-]+)""", re.IGNORECASE)
+
+# 헤더에 봇 명시 및 설명 url 추가 / github readme에 봇의 역할을 설명하는 부분 추가하기
+# 하루 특정 시간에 작동함과 전날과 비교의 역할 등을 설명
+USER_AGENT = "HelloPY-Bot/1.0 (https://github.com/HelloPy-Korea/JD-Scanner)"
+
+_MAX_RETRIES = 4
+_BACKOFF_FACTOR = 0.8
+_RETRY_STATUS = {429, 500, 502, 503, 504}
+# 서버가 Retry-After로 요구하는 대기 시간 상한(초)
+_MAX_RETRY_AFTER = 60.0
+
+# 채용공고 본문은 이보다 훨씬 작으므로 초과분은 내려받지 않음
+_MAX_BODY_BYTES = 2 * 1024 * 1024
+_READ_CHUNK_SIZE = 64 * 1024
+
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _ensure_dir(path: Path) -> Path:
+    """디렉터리를 프로세스당 한 번만 생성"""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """임시 파일에 한 번에 쓴 뒤 교체하여 부분적으로 쓰인 캐시 파일이 남지 않도록 저장"""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def _get_client() -> httpx.Client:
+    """HTTP/2 + 연결 풀을 사용하는 공유 httpx 클라이언트 반환"""
+    global _client
+    if _client is not None:
+        return _client
+    # 여러 스레드에서 동시에 처음 호출해도 클라이언트(연결 풀)는 하나만 생성
+    with _client_lock:
+        if _client is not None:
+            return _client
+        # 재시도는 _get_with_retry 한 곳에서만 처리 (transport 재시도와 곱해지지 않도록)
+        transport = httpx.HTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+        )
+        _client = httpx.Client(
+            transport=transport,
+            timeout=25,
+            follow_redirects=True,
+            headers={"User-Agent": USER_AGENT},
+        )
+    return _client
+
+
+def _read_capped(response: httpx.Response) -> bytes:
+    """응답 본문을 청크 단위로 읽되 _MAX_BODY_BYTES까지만 보관 (초과분은 읽지 않음)"""
+    body = bytearray()
+    for chunk in response.iter_bytes(_READ_CHUNK_SIZE):
+        body.extend(chunk)
+        if len(body) >= _MAX_BODY_BYTES:
+            del body[_MAX_BODY_BYTES:]
+            break
+    return bytes(body)
+
+
+def _is_html(response: httpx.Response) -> bool:
+    """HTML/XML 계열 응답인지 확인 (Content-Type이 없으면 HTML로 간주)"""
+    content_type = response.headers.get("Content-Type", "").lower()
+    return not content_type or "html" in content_type or "xml" in content_type
+
+
+def _retry_delay(retry_after: Optional[str], attempt: int) -> float:
+    """재시도 전 대기 시간 (Retry-After 헤더가 있으면 우선, 없으면 지수 백오프)"""
+    backoff = _BACKOFF_FACTOR * (2**attempt)
+    if not retry_after:
+        return backoff
+    try:
+        delay = float(retry_after)
+    except ValueError:
+        # HTTP-date 형식 (예: "Wed, 21 Oct 2026 07:28:00 GMT")
+        try:
+            when = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return backoff
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        delay = (when - datetime.now(timezone.utc)).total_seconds()
+    return min(max(delay, 0.0), _MAX_RETRY_AFTER)
+
+
+def _get_with_retry(
+    url: str, headers: Optional[Dict[str, str]] = None
+) -> Tuple[httpx.Response, bytes]:
+    """네트워크 요청 실패시 지수 백오프로 재요청 하는 함수 (응답과 본문 반환)"""
+    client = _get_client()
+    attempt = 0
+    while True:
+        retry_after = None
+        try:
+            # 본문은 스트리밍으로 받아 비정상적으로 큰 페이지를 끝까지 내려받지 않음
+            request = client.build_request("GET", url, headers=headers)
+            response = client.send(request, stream=True)
+            try:
+                if response.status_code not in _RETRY_STATUS or attempt >= _MAX_RETRIES:
+                    # JSON/PDF 등 파싱하지 않을 응답은 본문을 내려받지 않음
+                    body = _read_capped(response) if _is_html(response) else b""
+                    return response, body
+                retry_after = response.headers.get("Retry-After")
+            finally:
+                response.close()
+        except httpx.TransportError:
+            if attempt >= _MAX_RETRIES:
+                raise
+        time.sleep(_retry_delay(retry_after, attempt))
+        attempt += 1
+
+
+def _sniff_charset(html: bytes) -> str:
+    """문서 앞부분의 <meta charset>에서 인코딩 추출 (없으면 utf-8)"""
+    match = _META_CHARSET_RE.search(html, 0, 4096)
+    return match.group(1).decode("ascii") if match else "utf-8"
+
+
+def _resolve_charset(html: bytes, encoding: Optional[str] = None) -> str:
+    """응답 헤더 또는 <meta charset>의 인코딩 반환 (알 수 없는 인코딩이면 utf-8)"""
+    if not encoding:
+        encoding = _sniff_charset(html)
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        return "utf-8"
+    return encoding
+
+
+def _decode_html(html: bytes, encoding: Optional[str] = None) -> str:
+    """응답 헤더 또는 <meta charset>의 인코딩으로 HTML 디코딩 (기본 utf-8)"""
+    return html.decode(_resolve_charset(html, encoding), errors="replace")
+
+
+def _html_to_text(html: bytes, encoding: Optional[str] = None) -> str:
+    """HTML에서 script/style을 제외한 본문 텍스트 추출"""
+    if HTMLParser is not None:
+        tree = HTMLParser(_decode_html(html, encoding))
+        # script/style 노드를 C 레벨에서 한 번에 제거
+        tree.strip_tags(["script", "style"])
+        root = tree.body or tree.root
+        text = root.text(separator=" ", strip=True) if root is not None else ""
+    elif lxml_html is not None:
+        # 인코딩을 명시하여 libxml2의 인코딩 추측 생략
+        parser = lxml_html.HTMLParser(encoding=_resolve_charset(html, encoding))
+        root = lxml_html.document_fromstring(html, parser=parser)
+        for element in root.iter("script", "style"):
+            element.drop_tree()
+        # text_content()는 블록 사이 공백 없이 이어 붙이므로 텍스트 노드를 공백으로 결합
+        text = " ".join(root.itertext())
+    else:
+        from bs4 import BeautifulSoup
+
+        # 인코딩을 명시하여 bs4의 인코딩 추측(EncodingDetector) 생략
+        soup = BeautifulSoup(
+            html, "html.parser", from_encoding=_resolve_charset(html, encoding)
+        )
+        # SoupStrainer(parse_only)는 최상위 태그 생성만 거르고 중첩된 script/style은
+        # 그대로 트리에 남기므로 파싱 후 제거 (무거운 경로는 위 lexbor 파서가 담당)
+        for script in soup(["script", "style"]):
+            script.decompose()
+        text = soup.get_text(separator=" ", strip=True)
+    return " ".join(text.split())
 
 
 # robots.txt 만족시키는 함수 추가해야함
@@ -32,35 +212,113 @@ class WebParser:
             url : 파싱하는 사이트의 url
         """
         self.url = url
+        self.url_hash = hashlib.sha1(url.encode("utf-8")).hexdigest()
 
     def extract_content_from_url(self) -> str:
-        """채용 공고 추출"""
+        """채용 공고 추출 (변경되지 않은 페이지는 조건부 요청으로 캐시 재사용)"""
         try:
-            # 헤더에 봇 명시 및 설명 url 추가 / github readme에 봇의 역할을 설명하는 부분 추가하기
-            # 하루 특정 시간에 작동함과 전날과 비교의 역할 등을 설명
-            headers = {
-                "User-Agent": "HelloPY-Bot/1.0 (https://github.com/HelloPy-Korea/JD-Scanner)"
-            }
+            meta = self._load_raw_meta()
+            response, body = _get_with_retry(
+                self.url, self._conditional_headers(meta)
+            )
 
-            session = _build_requests_session()
+            if response.status_code == 304:
+                cached = self._load_raw_text()
+                if cached:
+                    return cached
+                # 캐시 파일이 손상된 경우 조건 없이 다시 요청
+                meta = {}
+                response, body = _get_with_retry(self.url)
 
-            response = session.get(self.url, headers=headers, timeout=25)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, "html.parser")
-
-            for script in soup(["script", "style"]):
-                script.decompose()
+            if not _is_html(response):
+                raise ValueError(
+                    f"지원하지 않는 콘텐츠 타입: {response.headers.get('Content-Type')}"
+                )
+            if not body:
+                raise ValueError("응답 본문이 비어있습니다.")
 
-            text = soup.get_text()
-            lines = (line.strip() for line in text.splitlines())
-            content = re.sub(r"\s+", " ", " ".join(lines)).strip()
+            content = _html_to_text(body, response.charset_encoding)
 
             if not content.strip():
                 raise ValueError("추출된 내용이 비어있습니다.")
+
+            self._save_raw_cache(response, body, content, meta)
             return content
 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             raise Exception(f"URL 요청 실패: {e}")
         except Exception as e:
             raise Exception(f"내용 추출 실패: {e}")
+
+    @classmethod
+    def extract_many(cls, urls: List[str], max_workers: int = 10) -> List[str]:
+        """여러 채용 공고를 공유 클라이언트(연결 풀)로 동시에 추출 (입력 순서대로 반환)
+
+        Args:
+            urls : 파싱할 사이트 url 목록
+            max_workers : 동시 요청 수 (연결 풀의 keep-alive 연결 수와 맞춤)
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(lambda url: cls(url).extract_content_from_url(), urls)
+            )
+
+    def _raw_path(self, suffix: str) -> Path:
+        return RAW_DIR / f"{self.url_hash}{suffix}"
+
+    def _load_raw_meta(self) -> Dict[str, Any]:
+        """캐시 메타데이터(etag, last_modified 등) 로드 (캐시 텍스트가 없으면 빈 dict)"""
+        if not self._raw_path(".txt").exists():
+            return {}
+        try:
+            return json.loads(self._raw_path(".json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _load_raw_text(self) -> str:
+        """캐시된 정제 텍스트 로드 (없으면 빈 문자열)"""
+        try:
+            return self._raw_path(".txt").read_text(encoding="utf-8")
+        except OSError:
+            return ""
+
+    def _conditional_headers(self, meta: Dict[str, Any]) -> Dict[str, str]:
+        """캐시가 있으면 If-None-Match / If-Modified-Since 헤더 생성"""
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def _save_raw_cache(
+        self,
+        response: httpx.Response,
+        html: bytes,
+        content: str,
+        meta: Dict[str, Any],
+    ) -> None:
+        """원문 HTML과 정제 텍스트를 output/raw에 캐시 (내용이 같으면 본문 쓰기 생략)"""
+        body_hash = hashlib.sha1(html).hexdigest()
+        new_meta = {
+            "url": self.url,
+            "body_sha1": body_hash,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        try:
+            _ensure_dir(RAW_DIR)
+            if meta.get("body_sha1") != body_hash:
+                _atomic_write_bytes(self._raw_path(".html"), html)
+                _atomic_write_bytes(self._raw_path(".txt"), content.encode("utf-8"))
+            # 메타는 본문 뒤에 기록 (중단되어도 새 본문과 옛 해시가 짝지어지지 않도록)
+            _atomic_write_bytes(
+                self._raw_path(".json"),
+                json.dumps(new_meta, ensure_ascii=False).encode("utf-8"),
+            )
+        except OSError:
+            # 캐시는 실패해도 추출 결과에는 영향 없음
+            pass
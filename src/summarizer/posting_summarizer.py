@@ -1,40 +1,98 @@
-from typing import Optional, Tuple
-
 from src.langchain.chain import JobSummaryChain
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Iterator, Optional, Tuple
+
+import hashlib
+import os
+import re
+
+# 공백/하이픈을 C 레벨 translate로 "_"로 바꾼 뒤, 비단어 문자와 "_"가 섞인 구간을
+# 한 번의 정규식 탐색으로 처리 ("_"가 포함되면 "_" 하나로, 아니면 삭제)
+_SLUG_TABLE = str.maketrans({" ": "_", "-": "_"})
+_SLUG_SEP = re.compile(r"[\W_]+")
+_TITLE_COMPANY_RE = re.compile(
+    r"^[ \t]*(?:##[ \t]*(공고명)|###[ \t]*(회사명))[ \t]*:(.*)$", re.MULTILINE
+)
+
+
+@lru_cache(maxsize=None)
+def _ensure_dir(path: Path) -> Path:
+    """디렉터리를 프로세스당 한 번만 생성"""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    """임시 파일에 한 번에 쓴 뒤 교체하여 부분적으로 쓰인 파일이 남지 않도록 저장"""
+    tmp_path = path.with_name(path.name + ".tmp")
+    # 미리 인코딩한 바이트를 한 번에 기록 (텍스트 래퍼의 버퍼 단위 인코딩/분할 쓰기 생략)
+    tmp_path.write_bytes(text.encode("utf-8"))
+    os.replace(tmp_path, path)
+
+
+def _slug_sep(match: "re.Match[str]") -> str:
+    return "_" if "_" in match.group() else ""
+
 
 def _slugify(value: str, max_length: int = 80) -> str:
-    allowed = []
-    for ch in value.lower().strip():
-        if ch.isalnum():
-            allowed.append(ch)
-        elif ch in [" ", "-", "_"]:
-            allowed.append("_")
-    slug = "".join(allowed)
-    while "__" in slug:
-        slug = slug.replace("__", "_")
-    slug = slug.strip("_")
+    slug = _SLUG_SEP.sub(_slug_sep, value.lower().translate(_SLUG_TABLE)).strip("_")
     return slug[:max_length] or "job_posting"
 
 
 class JobPostingSummarizer:
     def __init__(
-        self, content: str, model_name: str = "gpt-oss:20b", temperature: float = 0.1
+        self,
+        content: Optional[str] = None,
+        model_name: str = "gpt-oss:20b",
+        temperature: float = 0.1,
     ):
         """채용공고 요약기 초기화"""
         self.chain = JobSummaryChain(model_name=model_name, temperature=temperature)
         self.content = content
+        self._cache_dir = Path("output/.summary_cache")
 
     def summarize_job_posting(self, content: str, verbose: bool = False) -> str:
-        """채용공고 내용 요약 (토큰 제한 자동 처리)"""
+        """채용공고 내용 요약 (토큰 제한 자동 처리, 동일 공고는 캐시 사용)"""
+        return "".join(self.stream_job_posting(content, verbose=verbose))
+
+    def stream_job_posting(self, content: str, verbose: bool = False) -> Iterator[str]:
+        """채용공고 요약을 생성되는 대로 조각 단위로 반환 (완료 시 캐시 저장)"""
+        cache_path = self._cache_dir / f"{self._cache_key(content)}.md"
+        if cache_path.exists():
+            if verbose:
+                print(f"캐시된 요약 사용: {cache_path}")
+            yield cache_path.read_text(encoding="utf-8")
+            return
+
+        parts = []
         try:
-            result = self.chain.run_summary(content, verbose=verbose)
-            return result
+            for chunk in self.chain.stream_summary(content, verbose=verbose):
+                parts.append(chunk)
+                yield chunk
         except Exception as e:
             raise Exception(f"요약 처리 실패: {e}")
 
+        self._write_cache(cache_path, "".join(parts))
+
+    def _cache_key(self, content: str) -> str:
+        """모델 설정, 프롬프트, 정규화된 공고 내용으로 캐시 키 생성"""
+        normalized = " ".join(content.split())
+        raw = (
+            f"{self.chain.model_name}|{self.chain.temperature}|"
+            f"{self.chain.prompt_fingerprint()}|{normalized}"
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _write_cache(self, cache_path: Path, summary: str) -> None:
+        """요약 결과를 캐시에 원자적으로 저장 (실패해도 요약 결과는 반환)"""
+        try:
+            _ensure_dir(self._cache_dir)
+            _atomic_write_text(cache_path, summary)
+        except OSError:
+            pass
+
     def save_summary(self, summary: str, filename: Optional[str] = None) -> str:
         """요약 결과를 파일로 저장"""
         if filename is None:
@@ -43,14 +101,9 @@ class JobPostingSummarizer:
             mid = f"{c_slug}_{t_slug}".strip("_") or "job_posting"
             filename = f"job_posting_{mid}_{timestamp}.md"
 
-        output_dir = Path("output")
-        output_dir.mkdir(exist_ok=True)
-
-        file_path = output_dir / filename
-
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(summary)
+            file_path = _ensure_dir(Path("output")) / filename
+            _atomic_write_text(file_path, summary)
             return str(file_path)
         except Exception as e:
             raise Exception(f"파일 저장 실패: {e}")
@@ -58,16 +111,12 @@ class JobPostingSummarizer:
     def _extract_title_company(self, summary: str) -> Tuple[str, str]:
         title = ""
         company = ""
-        for line in summary.splitlines():
-            txt = line.strip()
-            if not title and (
-                txt.startswith("## 공고명:") or txt.startswith("## 공고명 :")
-            ):
-                title = txt.split(":", 1)[-1].strip()
-            if not company and (
-                txt.startswith("### 회사명:") or txt.startswith("### 회사명 :")
-            ):
-                company = txt.split(":", 1)[-1].strip()
+        for match in _TITLE_COMPANY_RE.finditer(summary):
+            value = match.group(3).strip()
+            if match.group(1) and not title:
+                title = value
+            elif match.group(2) and not company:
+                company = value
             if title and company:
                 break
-        return _slugify(title), _slugify(company)
\ No newline at end of file
+        return _slugify(title), _slugify(company)
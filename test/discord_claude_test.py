@@ -2,6 +2,7 @@
 import discord
 import os
 import asyncio
+import sys
 from dotenv import load_dotenv
 from pathlib import Path
 
@@ -13,42 +14,35 @@ load_dotenv(dotenv_path=env_path)
 DISCORD_TOKEN = os.getenv('DISCORD_BOT_TOKEN')
 CHANNEL_ID = int(os.getenv('DISCORD_CHANNEL_IDS'))
 
-async def send_message(message_text):
-    """단순히 메시지 하나만 보내는 함수"""
-    
-    # Intents 설정
-    intents = discord.Intents.default()
-    intents.message_content = True
-    
-    # Client 생성
-    client = discord.Client(intents=intents)
-    
+# ============ 공유 클라이언트 ============
+# 메시지마다 로그인하지 않도록 src/discord/discord_sender.py의 공유 클라이언트(백그라운드 루프) 재사용
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.discord import discord_sender  # noqa: E402
+
+
+def _run(coro_fn, *args):
+    """공유 클라이언트로 로그인(최초 1회)한 뒤 coro_fn(client, *args)를 그 루프에서 실행하고 결과를 기다림"""
+    client = discord_sender._get_client(DISCORD_TOKEN)
+    future = asyncio.run_coroutine_threadsafe(
+        coro_fn(client, *args), discord_sender._get_loop()
+    )
+    return future.result()
+
+
+async def send_message(client, message_text):
+    """단순히 메시지 하나만 보내는 함수 (공유 클라이언트 재사용)"""
     try:
-        @client.event
-        async def on_ready():
-            print(f'✅ {client.user} 로그인 완료!')
-            
-            # 채널 찾기
-            channel = client.get_channel(CHANNEL_ID)
-            if channel:
-                # 메시지 보내기
-                await channel.send(message_text)
-                print(f'📤 메시지 전송 완료: {message_text}')
-            else:
-                print(f'❌ 채널을 찾을 수 없습니다. (ID: {CHANNEL_ID})')
-            
-            # 봇 종료
-            await client.close()
-        
-        # 봇 시작
-        await client.start(DISCORD_TOKEN)
-        
+        # 채널 찾기
+        channel = client.get_channel(CHANNEL_ID)
+        if channel:
+            # 메시지 보내기
+            await channel.send(message_text)
+            print(f'📤 메시지 전송 완료: {message_text}')
+        else:
+            print(f'❌ 채널을 찾을 수 없습니다. (ID: {CHANNEL_ID})')
+
     except Exception as e:
         print(f'❌ 오류 발생: {e}')
-    finally:
-        # 확실히 연결 종료
-        if not client.is_closed():
-            await client.close()
 
 # 실행 함수
 def send_discord_message(text):
@@ -63,8 +57,8 @@ def send_discord_message(text):
             print("❌ CHANNEL_ID가 .env 파일에 없습니다!")
             return
         
-        # 비동기 함수 실행
-        asyncio.run(send_message(text))
+        # 공유 클라이언트의 루프에서 실행
+        _run(send_message, text)
         
     except Exception as e:
         print(f"❌ 실행 오류: {e}")
@@ -82,27 +76,16 @@ if __name__ == "__main__":
 # ============ 더 간단한 버전 (함수형) ============
 
 def quick_send(message):
-    """빠르게 메시지 보내기"""
-    import asyncio
-    
-    async def _send():
-        client = discord.Client(intents=discord.Intents.default())
-        
-        @client.event
-        async def on_ready():
-            channel = client.get_channel(CHANNEL_ID)
-            await channel.send(message)
-            await client.close()
-        
-        try:
-            await client.start(DISCORD_TOKEN)
-        except:
-            pass
-        finally:
-            if not client.is_closed():
-                await client.close()
-    
-    asyncio.run(_send())
+    """빠르게 메시지 보내기 (이미 로그인된 클라이언트 재사용)"""
+    try:
+        _run(_quick_send, message)
+    except Exception:
+        pass
+
+
+async def _quick_send(client, message):
+    channel = client.get_channel(CHANNEL_ID)
+    await channel.send(message)
 
 # 사용법: quick_send("빠른 메시지!")
 
@@ -110,30 +93,21 @@ def quick_send(message):
 # ============ 여러 메시지 연속 전송 버전 ============
 
 async def send_multiple_messages(messages):
-    """여러 메시지를 연속으로 보내기"""
-    intents = discord.Intents.default()
-    client = discord.Client(intents=intents)
-    
-    @client.event
-    async def on_ready():
-        print(f'✅ {client.user} 로그인 완료!')
-        channel = client.get_channel(CHANNEL_ID)
-        
-        if channel:
-            for i, msg in enumerate(messages, 1):
-                await channel.send(msg)
-                print(f'📤 메시지 {i}/{len(messages)} 전송: {msg}')
-                await asyncio.sleep(1)  # 1초 간격
-        
-        await client.close()
-    
+    """여러 메시지를 연속으로 보내기 (어느 이벤트 루프에서 호출해도 공유 클라이언트 사용)"""
     try:
-        await client.start(DISCORD_TOKEN)
-    except:
+        await asyncio.to_thread(_run, _send_multiple, messages)
+    except Exception:
         pass
-    finally:
-        if not client.is_closed():
-            await client.close()
+
+
+async def _send_multiple(client, messages):
+    channel = client.get_channel(CHANNEL_ID)
+
+    if channel:
+        for i, msg in enumerate(messages, 1):
+            await channel.send(msg)
+            print(f'📤 메시지 {i}/{len(messages)} 전송: {msg}')
+            await asyncio.sleep(1)  # 1초 간격
 
 # 사용법:
 # messages = ["첫 번째 메시지", "두 번째 메시지", "세 번째 메시지"]
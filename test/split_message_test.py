@@ -0,0 +1,30 @@
+# SimpleDiscordSender.split_message 분할 결과 검사 (python -m pytest test/split_message_test.py)
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.discord.discord_sender import SimpleDiscordSender  # noqa: E402
+
+LIMIT = 1900
+
+
+def test_newline_run_at_limit_boundary():
+    """1900자 경계에 걸친 줄바꿈 연속 구간이 공백뿐인 조각으로 남지 않아야 함"""
+    content = "가" * (LIMIT - 1) + "\n" * (LIMIT + 50) + "나" * 50
+    parts = SimpleDiscordSender.split_message(content, LIMIT)
+
+    assert parts == ["가" * (LIMIT - 1), "나" * 50]
+
+
+def test_parts_are_stripped_and_within_limit():
+    content = ("줄 내용입니다\n\n" * 300) + "끝"
+    parts = SimpleDiscordSender.split_message(content, LIMIT)
+
+    assert len(parts) > 1
+    assert all(part and part == part.strip() for part in parts)
+    assert all(len(part) <= LIMIT for part in parts)
+    assert "".join(parts).replace("\n", "") == content.replace("\n", "")
+
+
+def test_whitespace_only_content_is_dropped():
+    assert SimpleDiscordSender.split_message("\n \n\t") == []